@@ -2,9 +2,48 @@
 import argparse
 import csv
 import os
+import re
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 
+# JLCPCB output headers
+BOM_HEADER = ('Comment', 'Designator', 'Footprint', 'JLCPCB Part #（optional）')
+POS_HEADER = ('Designator', 'Mid X', 'Mid Y', 'Layer', 'Rotation')
+
+# Read/write buffer size for CSV files; large BOM/PnP files bottleneck on buffer refills
+IO_BUFFER_SIZE = 1 << 20
+
+# Component type assumed from the designator prefix when no part number is known
+DESCRIPTION_BY_PREFIX = {'C': 'Capacitor', 'D': 'Diode', 'R': 'Resistor', 'L': 'Inductor'}
+
+# Enhanced KiCAD BOM columns holding LCSC part numbers, in priority order
+LCSC_COLUMNS = ['LCSC', 'LCSC #', 'China LCSC #', 'Alternate LCSC #']
+
+# Placeholder part numbers treated as empty
+NOT_AVAILABLE_VALUES = frozenset(['n/a', 'na', ''])
+
+# KiCAD Positions side to JLCPCB layer, including the common spellings as-is
+SIDE_TO_LAYER = {
+    'top': 'Top', 'Top': 'Top', 'TOP': 'Top',
+    'bottom': 'Bottom', 'Bottom': 'Bottom', 'BOTTOM': 'Bottom',
+}
+
+# One designator in a comma-separated list, without surrounding whitespace
+DESIGNATOR_RE = re.compile(r'[^,\s]+(?:[ \t]+[^,\s]+)*')
+
+# Characters other than the delimiter that make csv.writer quote a field
+CSV_QUOTE_CHARS_RE = re.compile(r'["\r\n]')
+
+# Side suffix on Fusion PnP file names, e.g. project_pnp_front.csv
+POS_SIDE_SUFFIX_RE = re.compile(r'_(front|back)$', re.IGNORECASE)
+
+
+class KiCadDialect(csv.excel):
+    # KiCAD quotes most fields; let the parser unquote them, including after "; " or ", "
+    quotechar = '"'
+    skipinitialspace = True
+
 
 def show_help():
     help_text = """
@@ -34,195 +73,181 @@ Notes:
     print(help_text)
 
 
+def get_column(row, index):
+    # Get a field by its column index, tolerating missing columns and short rows
+    if index is not None and index < len(row):
+        return row[index]
+    return ''
+
+
+def read_header(reader):
+    # Read the header row once and map each column name to its index
+    header = next(reader, [])
+    return {name: i for i, name in enumerate(header)}
+
+
 def convert_fusion_bom(input_file, output_file):
     # Convert Fusion BOM format to JLCPCB BOM format
-    try:
-        with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            
-            # JLCPCB BOM format: Comment,Designator,Footprint,JLCPCB Part #（optional）
-            output_rows = []
-            
-            for row in reader:
-                # Extract relevant fields
-                designator = row.get('Part', '')
-                value = row.get('Value', '')
-                package = row.get('Package', '')
-                
-                # Skip empty rows or test points
-                if not designator or not value:
-                    continue
-                
-                # Use value as comment (component value like "100pF", "1k", etc.)
-                comment = value
-                footprint = package
-                jlcpcb_part = ''  # Optional field, leave empty for now.  TODO Later.
-                
-                output_rows.append({
-                    'Comment': comment,
-                    'Designator': designator,
-                    'Footprint': footprint,
-                    'JLCPCB Part #（optional）': jlcpcb_part
-                })
-        
-        # Write output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Comment', 'Designator', 'Footprint', 'JLCPCB Part #（optional）']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(output_rows)
-        
-        print(f"BOM conversion completed: {output_file}")
-        print(f"Converted {len(output_rows)} components")
-        
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error converting BOM: {e}")
-        sys.exit(1)
+    with open(input_file, 'r', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as infile, \
+            open(output_file, 'w', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as outfile:
+        reader = csv.reader(infile)
+        column_index = read_header(reader)
+        part_idx = column_index.get('Part')
+        value_idx = column_index.get('Value')
+        package_idx = column_index.get('Package')
+
+        writer = csv.writer(outfile)
+        writer.writerow(BOM_HEADER)
+        count = 0
+
+        for row in reader:
+            # Extract relevant fields
+            designator = get_column(row, part_idx)
+            value = get_column(row, value_idx)
+            package = get_column(row, package_idx)
+
+            # Skip empty rows or test points
+            if not designator or not value:
+                continue
+
+            # Use value as comment (component value like "100pF", "1k", etc.)
+            comment = value
+            footprint = package
+            jlcpcb_part = ''  # Optional field, leave empty for now.  TODO Later.
+
+            writer.writerow((comment, designator, footprint, jlcpcb_part))
+            count += 1
+
+    print(f"BOM conversion completed: {output_file}")
+    print(f"Converted {count} components")
 
 
 def convert_kicad_bom(input_file, output_file):
     # Convert KiCAD BOM format to JLCPCB BOM format
-    try:
-        # First, detect the format by reading the header
-        with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-            first_line = infile.readline().strip()
-            
+    with open(input_file, 'r', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as infile:
+        # First, detect the format from the header bytes. peek() looks at the read buffer
+        # without decoding or consuming it, so the converter still starts at the top.
+        head = infile.buffer.peek()
+        if b'\n' in head:
+            first_line = head.split(b'\n', 1)[0]
+        else:
+            # Header longer than the buffered bytes: read the whole line, then rewind
+            first_line = infile.buffer.readline()
+            infile.seek(0)
+
         # Determine if this is the enhanced format (comma-delimited with many columns)
         # or the simple format (semicolon-delimited)
-        is_enhanced_format = ('Reference' in first_line and ('LCSC' in first_line or 'Value' in first_line))
-        
+        is_enhanced_format = (b'Reference' in first_line and (b'LCSC' in first_line or b'Value' in first_line))
+
         if is_enhanced_format:
-            convert_kicad_bom_enhanced(input_file, output_file)
+            convert_kicad_bom_enhanced(infile, output_file)
         else:
-            convert_kicad_bom_simple(input_file, output_file)
-            
-    except Exception as e:
-        print(f"Error converting BOM: {e}")
-        sys.exit(1)
+            convert_kicad_bom_simple(infile, output_file)
 
 
-def convert_kicad_bom_simple(input_file, output_file):
-    # Convert simple KiCAD BOM format (semicolon-delimited) to JLCPCB BOM format
-    try:
-        with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile, delimiter=';')
-            
-            # JLCPCB BOM format: Comment,Designator,Footprint,JLCPCB Part #（optional）
-            output_rows = []
-            
-            for row in reader:
-                # Extract relevant fields
-                designators_str = row.get('Designator', '').strip('"')
-                value = row.get('Designation', '').strip('"')
-                footprint = row.get('Footprint', '').strip('"')
-                
-                # Skip empty rows
-                if not designators_str or not value:
-                    continue
-                
-                # Split comma-separated designators
-                designators = [d.strip() for d in designators_str.split(',') if d.strip()]
-                
-                # Create a row for each designator
-                for designator in designators:
-                    output_rows.append({
-                        'Comment': value,
-                        'Designator': designator,
-                        'Footprint': footprint,
-                        'JLCPCB Part #（optional）': ''
-                    })
-        
-        # Write output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Comment', 'Designator', 'Footprint', 'JLCPCB Part #（optional）']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(output_rows)
-        
-        print(f"BOM conversion completed: {output_file}")
-        print(f"Converted {len(output_rows)} components")
-        
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error converting BOM: {e}")
-        sys.exit(1)
+def convert_kicad_bom_simple(infile, output_file):
+    # Convert simple KiCAD BOM format (semicolon-delimited) from an open file to JLCPCB BOM format
+    with open(output_file, 'w', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as outfile:
+        reader = csv.reader(infile, dialect=KiCadDialect, delimiter=';')
+        column_index = read_header(reader)
+        designator_idx = column_index.get('Designator')
+        designation_idx = column_index.get('Designation')
+        footprint_idx = column_index.get('Footprint')
 
+        writer = csv.writer(outfile)
+        writer.writerow(BOM_HEADER)
+        count = 0
+
+        for row in reader:
+            # Extract relevant fields
+            designators_str = get_column(row, designator_idx)
+            value = get_column(row, designation_idx)
+            footprint = get_column(row, footprint_idx)
+
+            # Skip empty rows
+            if not designators_str or not value:
+                continue
+
+            # Split comma-separated designators and write a row for each one
+            for designator in DESIGNATOR_RE.findall(designators_str):
+                writer.writerow((value, designator, footprint, ''))
+                count += 1
+
+    print(f"BOM conversion completed: {output_file}")
+    print(f"Converted {count} components")
 
-def convert_kicad_bom_enhanced(input_file, output_file):
-    # Convert enhanced KiCAD BOM format (comma-delimited with detailed columns) to JLCPCB BOM format
-    try:
-        with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            
-            # JLCPCB BOM format: Comment,Designator,Footprint,JLCPCB Part #（optional）
-            output_rows = []
-            
-            for row in reader:
-                # Extract basic fields
-                reference = row.get('Reference', '').strip('"')
-                value = row.get('Value', '').strip('"')
-                footprint = row.get('Footprint', '').strip('"')
-                dnp = row.get('DNP', '').strip('"')
-                exclude_from_bom = row.get('Exclude from BOM', '').strip('"')
-                
-                # Skip empty rows
-                if not reference or not value:
-                    continue
-                
-                # Skip components marked as DNP (Do Not Place) or excluded from BOM
-                if dnp.lower() in ['true', 'yes', '1', 'x'] or exclude_from_bom.lower() in ['true', 'yes', '1', 'x', 'excluded from bom']:
-                    continue
-                
-                # Find LCSC part number using priority order
-                lcsc_part = get_priority_value(row, ['LCSC', 'LCSC #', 'China LCSC #', 'Alternate LCSC #'])
-                
-                # Find part number using priority order
-                part_number = get_priority_value(row, ['MFG Part Number', 'China MFG PN', 'Alternate MFG Part Number'])
-                
-                # Generate description/comment - use the value as the primary comment
-                comment = value
-                
-                # Split comma-separated references
-                references = [r.strip() for r in reference.split(',') if r.strip()]
-                
-                # Create a row for each reference
-                for ref in references:
-                    output_rows.append({
-                        'Comment': comment,
-                        'Designator': ref,
-                        'Footprint': footprint,
-                        'JLCPCB Part #（optional）': lcsc_part
-                    })
-        
-        # Write output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Comment', 'Designator', 'Footprint', 'JLCPCB Part #（optional）']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(output_rows)
-        
-        print(f"BOM conversion completed: {output_file}")
-        print(f"Converted {len(output_rows)} components")
-        
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error converting BOM: {e}")
-        sys.exit(1)
 
+def write_bom_row(outfile, writer, row):
+    # Write a BOM row directly when no field needs quoting, otherwise let csv quote it
+    line = ','.join(row)
+    if line.count(',') == len(row) - 1 and not CSV_QUOTE_CHARS_RE.search(line):
+        outfile.write(line + writer.dialect.lineterminator)
+    else:
+        writer.writerow(row)
 
-def get_priority_value(row, column_names):
-    # Get the first non-empty value from a list of column names in priority order
-    for col_name in column_names:
-        value = row.get(col_name, '').strip().strip('"')
-        if value and value.lower() not in ['n/a', 'na', '']:
-            return value
+
+def convert_kicad_bom_enhanced(infile, output_file):
+    # Convert enhanced KiCAD BOM format (comma-delimited with detailed columns) from an open file
+    # to JLCPCB BOM format
+    with open(output_file, 'w', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as outfile:
+        reader = csv.reader(infile, dialect=KiCadDialect)
+        column_index = read_header(reader)
+        reference_idx = column_index.get('Reference')
+        value_idx = column_index.get('Value')
+        footprint_idx = column_index.get('Footprint')
+        dnp_idx = column_index.get('DNP')
+        exclude_idx = column_index.get('Exclude from BOM')
+        lcsc_idxs = get_column_indices(column_index, LCSC_COLUMNS)
+
+        writer = csv.writer(outfile)
+        writer.writerow(BOM_HEADER)
+        count = 0
+
+        for row in reader:
+            # Extract basic fields
+            reference = get_column(row, reference_idx)
+            value = get_column(row, value_idx)
+            footprint = get_column(row, footprint_idx)
+            dnp = get_column(row, dnp_idx)
+            exclude_from_bom = get_column(row, exclude_idx)
+
+            # Skip empty rows
+            if not reference or not value:
+                continue
+
+            # Skip components marked as DNP (Do Not Place) or excluded from BOM
+            if dnp.lower() in ['true', 'yes', '1', 'x'] or exclude_from_bom.lower() in ['true', 'yes', '1', 'x', 'excluded from bom']:
+                continue
+
+            # Find LCSC part number using priority order
+            lcsc_part = get_priority_value(row, lcsc_idxs)
+
+            # Use the value as the primary comment. It is not combined with the
+            # MFG part number, so the part number columns are not looked up per row.
+            comment = value
+
+            # Split comma-separated references and write a row for each one
+            for ref in DESIGNATOR_RE.findall(reference):
+                write_bom_row(outfile, writer, (comment, ref, footprint, lcsc_part))
+                count += 1
+
+    print(f"BOM conversion completed: {output_file}")
+    print(f"Converted {count} components")
+
+
+def get_column_indices(column_index, column_names):
+    # Resolve column names to indices once, keeping priority order and dropping missing columns
+    return [column_index[col_name] for col_name in column_names if col_name in column_index]
+
+
+def get_priority_value(row, indices):
+    # Get the first non-empty value from a list of column indices in priority order
+    row_len = len(row)
+    for i in indices:
+        if i < row_len:
+            value = row[i].strip()
+            if value and value.lower() not in NOT_AVAILABLE_VALUES:
+                return value
     return ''
 
 
@@ -231,22 +256,13 @@ def generate_description(value, part_number, reference):
     # If we have both value and part number, combine them
     if value and part_number:
         return f"{value} {part_number}"
-    
+
     # If we only have value but no part number, use designator-based assumptions
     if value:
-        ref_prefix = reference.split(',')[0].strip()  # Use first reference if multiple
-        
-        if ref_prefix.upper().startswith('C'):
-            return f"{value} Capacitor"
-        elif ref_prefix.upper().startswith('D'):
-            return f"{value} Diode"
-        elif ref_prefix.upper().startswith('R'):
-            return f"{value} Resistor"
-        elif ref_prefix.upper().startswith('L'):
-            return f"{value} Inductor"
-        else:
-            return value
-    
+        # Only the first character of the first reference is needed
+        suffix = DESCRIPTION_BY_PREFIX.get(reference.lstrip()[:1].upper())
+        return f"{value} {suffix}" if suffix else value
+
     # Fallback to just the reference if nothing else
     return reference
 
@@ -256,135 +272,111 @@ def find_pos_files(input_file):
     input_path = Path(input_file)
     base_name = input_path.stem
     directory = input_path.parent
-    
+
     # Remove _front or _back suffix if present
-    if base_name.endswith('_front'):
-        base_name = base_name[:-6]
-    elif base_name.endswith('_back'):
-        base_name = base_name[:-5]
-    
-    # Look for both front and back files
-    front_file = directory / f"{base_name}_front.csv"
-    back_file = directory / f"{base_name}_back.csv"
-    
+    base_name = POS_SIDE_SUFFIX_RE.sub('', base_name, count=1)
+
+    # Look for both front and back files with a single directory scan. Names are matched
+    # case-insensitively, as exists() does on Windows and macOS, preferring an exact match.
+    try:
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        names = set()
+    folded_names = {name.casefold(): name for name in names}
+
     files = []
-    if front_file.exists():
-        files.append(str(front_file))
-    if back_file.exists():
-        files.append(str(back_file))
-    
+    for name in (f"{base_name}_front.csv", f"{base_name}_back.csv"):
+        if name not in names:
+            name = folded_names.get(name.casefold())
+        if name:
+            files.append(str(directory / name))
+
     # If no _front/_back files found, assume the input file is the only one
     if not files:
         files.append(input_file)
-    
+
     return files
 
 
 def convert_fusion_pnp(input_files, output_file):
     # Convert Fusion PnP format to JLCPCB Positions format
-    try:
-        output_rows = []
-        
-        for input_file in input_files:
-            # Determine layer from filename
-            layer = "Top" if "_front" in input_file else "Bottom"
-            
-            with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                
-                for row in reader:
-                    # Extract relevant fields
-                    designator = row.get('Name', '')
-                    x = row.get('X', '')
-                    y = row.get('Y', '')
-                    rotation = row.get('Angle', '0')
-                    
-                    # Skip empty rows
-                    if not designator or not x or not y:
-                        continue
-                    
-                    # Format coordinates with mm suffix
-                    mid_x = x
-                    mid_y = y
-                    
-                    output_rows.append({
-                        'Designator': designator,
-                        'Mid X': mid_x,
-                        'Mid Y': mid_y,
-                        'Layer': layer,
-                        'Rotation': rotation
-                    })
-        
-        # Write output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Designator', 'Mid X', 'Mid Y', 'Layer', 'Rotation']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(output_rows)
-        
-        print(f"Positions conversion completed: {output_file}")
-        print(f"Converted {len(output_rows)} components from {len(input_files)} files")
-        
-    except FileNotFoundError as e:
-        print(f"Error: Input file not found: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error converting Positions: {e}")
-        sys.exit(1)
+    with ExitStack() as stack:
+        # Open every input before creating the output, so a missing file leaves no partial output
+        infiles = [stack.enter_context(open(input_file, 'r', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8'))
+                   for input_file in input_files]
+        outfile = stack.enter_context(open(output_file, 'w', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8'))
+        writer = csv.writer(outfile)
+        writer.writerow(POS_HEADER)
+        count = 0
 
+        # Stream each input file in turn rather than holding them all in memory
+        for input_file, infile in zip(input_files, infiles):
+            # Determine layer from the file name only, not its parent directories
+            layer = "Top" if Path(input_file).stem.casefold().endswith('_front') else "Bottom"
+
+            reader = csv.reader(infile)
+            column_index = read_header(reader)
+            name_idx = column_index.get('Name')
+            x_idx = column_index.get('X')
+            y_idx = column_index.get('Y')
+            angle_idx = column_index.get('Angle')
 
-def convert_kicad_pnp(input_file, output_file):
-    """Convert KiCAD Positions format to JLCPCB Positions format"""
-    try:
-        output_rows = []
-        
-        with open(input_file, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            
             for row in reader:
                 # Extract relevant fields
-                designator = row.get('Ref', '').strip('"')
-                x = row.get('PosX', '')
-                y = row.get('PosY', '')
-                rotation = row.get('Rot', '0')
-                side = row.get('Side', '').lower().strip('"')
-                
+                designator = get_column(row, name_idx)
+                x = get_column(row, x_idx)
+                y = get_column(row, y_idx)
+                rotation = get_column(row, angle_idx) or '0'
+
                 # Skip empty rows
                 if not designator or not x or not y:
                     continue
-                
-                # Map KiCAD side to JLCPCB layer format
-                if side == 'top':
-                    layer = 'Top'
-                elif side == 'bottom':
-                    layer = 'Bottom'
-                else:
-                    layer = 'Top'  # Default to top if unclear
-                
-                output_rows.append({
-                    'Designator': designator,
-                    'Mid X': x,
-                    'Mid Y': y,
-                    'Layer': layer,
-                    'Rotation': rotation
-                })
-        
-        # Write output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Designator', 'Mid X', 'Mid Y', 'Layer', 'Rotation']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(output_rows)
-        
-        print(f"Positions conversion completed: {output_file}")
-        print(f"Converted {len(output_rows)} components")
-        
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error converting Positions: {e}")
-        sys.exit(1)
+
+                # Coordinates pass through unchanged; layer is fixed for the whole file
+                writer.writerow((designator, x, y, layer, rotation))
+                count += 1
+
+    print(f"Positions conversion completed: {output_file}")
+    print(f"Converted {count} components from {len(input_files)} files")
+
+
+def convert_kicad_pnp(input_file, output_file):
+    """Convert KiCAD Positions format to JLCPCB Positions format"""
+    with open(input_file, 'r', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as infile, \
+            open(output_file, 'w', buffering=IO_BUFFER_SIZE, newline='', encoding='utf-8') as outfile:
+        reader = csv.reader(infile, dialect=KiCadDialect)
+        column_index = read_header(reader)
+        ref_idx = column_index.get('Ref')
+        x_idx = column_index.get('PosX')
+        y_idx = column_index.get('PosY')
+        rot_idx = column_index.get('Rot')
+        side_idx = column_index.get('Side')
+
+        writer = csv.writer(outfile)
+        writer.writerow(POS_HEADER)
+        count = 0
+
+        for row in reader:
+            # Extract relevant fields
+            designator = get_column(row, ref_idx)
+            x = get_column(row, x_idx)
+            y = get_column(row, y_idx)
+            rotation = get_column(row, rot_idx) or '0'
+            side = get_column(row, side_idx)
+
+            # Skip empty rows
+            if not designator or not x or not y:
+                continue
+
+            # Map KiCAD side to JLCPCB layer format, only lowercasing unusual spellings
+            layer = SIDE_TO_LAYER.get(side) or SIDE_TO_LAYER.get(side.lower(), 'Top')  # Default to top if unclear
+
+            writer.writerow((designator, x, y, layer, rotation))
+            count += 1
+
+    print(f"Positions conversion completed: {output_file}")
+    print(f"Converted {count} components")
 
 
 def main():
@@ -423,19 +415,33 @@ def main():
     # Process BOM conversion
     if args.bom:
         output_file = f"{args.out}_bom.csv"
-        if args.fusion:
-            convert_fusion_bom(args.bom, output_file)
-        elif args.kicad:
-            convert_kicad_bom(args.bom, output_file)
+        try:
+            if args.fusion:
+                convert_fusion_bom(args.bom, output_file)
+            elif args.kicad:
+                convert_kicad_bom(args.bom, output_file)
+        except FileNotFoundError as e:
+            print(f"Error: File '{e.filename}' not found")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error converting BOM: {e}")
+            sys.exit(1)
     
     # Process position conversion
     if args.pos:
         output_file = f"{args.out}_pos.csv"
-        if args.fusion:
-            pos_files = find_pos_files(args.pos)
-            convert_fusion_pnp(pos_files, output_file)
-        elif args.kicad:
-            convert_kicad_pnp(args.pos, output_file)
+        try:
+            if args.fusion:
+                pos_files = find_pos_files(args.pos)
+                convert_fusion_pnp(pos_files, output_file)
+            elif args.kicad:
+                convert_kicad_pnp(args.pos, output_file)
+        except FileNotFoundError as e:
+            print(f"Error: File '{e.filename}' not found")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error converting Positions: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":